@@ -1,14 +1,165 @@
 import discord
 import aiohttp
 import asyncio
-from datetime import datetime
+import functools
+import ipaddress
+from dataclasses import dataclass
 import logging
+import random
+import re
+import socket
+import string
+import threading
+import time
 from redbot.core import commands, Config
+from redbot.core.utils.chat_formatting import pagify
 from discord.ext import tasks
-from typing import Optional
+from typing import Callable, Mapping, Optional, Union
+from yarl import URL
+
+try:
+    import aiodns  # noqa: F401  # Enables aiohttp.AsyncResolver.
+except ImportError:
+    aiodns = None
 
 logger = logging.getLogger(__name__)
 
+_FORMATTER = string.Formatter()
+
+def _compile_field(field: str, spec: str, conversion: Optional[str]) -> Callable[[dict], str]:
+    """Build a getter that renders one replacement field from a mapping of placeholder values."""
+    root = field.partition(".")[0].partition("[")[0]
+    raw = "{" + field + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}"
+    if field == root and not spec and not conversion:
+        def simple(values: dict) -> str:
+            # Unknown placeholders are left in the output as written.
+            return str(values[field]) if field in values else raw
+        return simple
+
+    def full(values: dict) -> str:
+        if root not in values:
+            return raw
+        obj, _ = _FORMATTER.get_field(field, (), values)
+        obj = _FORMATTER.convert_field(obj, conversion)
+        return _FORMATTER.format_field(obj, spec or "")
+    return full
+
+
+def _compile_template(template: str) -> Callable[[dict], str]:
+    """
+    Compile a custom message into a render function. The template is parsed once;
+    literal text is kept as-is and each placeholder becomes a pre-built getter.
+    """
+    pieces: list[Union[str, Callable[[dict], str]]] = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        if literal:
+            pieces.append(literal)
+        if field is not None:
+            pieces.append(_compile_field(field, spec, conversion))
+    if all(isinstance(piece, str) for piece in pieces):
+        constant = "".join(pieces)
+        return lambda values: constant
+    return lambda values: "".join(piece if isinstance(piece, str) else piece(values) for piece in pieces)
+
+
+# Discord embed limits.
+EMBED_MAX_FIELDS = 25
+EMBED_FIELD_LIMIT = 1024
+EMBED_TOTAL_LIMIT = 6000
+EMBEDS_PER_MESSAGE = 10
+
+
+def _add_embed_field(embeds: list[discord.Embed], title: str, name: str, value: str) -> None:
+    """
+    Add a field to the last embed in the list, starting a new embed with the same title
+    when the field count or total size limit would be exceeded. Long values are split
+    over several fields.
+    """
+    pages = list(pagify(value, page_length=EMBED_FIELD_LIMIT)) or ["\u200b"]
+    for index, page in enumerate(pages):
+        field_name = name[:256] if index == 0 else f"{name[:245]} (cont.)"
+        embed = embeds[-1] if embeds else None
+        if (
+            embed is None
+            or len(embed.fields) >= EMBED_MAX_FIELDS
+            or len(embed) + len(field_name) + len(page) > EMBED_TOTAL_LIMIT
+        ):
+            embed = discord.Embed(title=title, color=discord.Color.blue())
+            embeds.append(embed)
+        embed.add_field(name=field_name, value=page, inline=False)
+
+
+def _group_embeds(embeds: list[discord.Embed]) -> list[list[discord.Embed]]:
+    """Pack embeds into messages of at most 10 embeds and 6000 characters each."""
+    groups: list[list[discord.Embed]] = []
+    size = 0
+    for embed in embeds:
+        if not groups or len(groups[-1]) >= EMBEDS_PER_MESSAGE or size + len(embed) > EMBED_TOTAL_LIMIT:
+            groups.append([])
+            size = 0
+        groups[-1].append(embed)
+        size += len(embed)
+    return groups
+
+
+_HOSTNAME_RE = re.compile(r"^(?=.{1,253}$)(?!-)[A-Za-z0-9-]{1,63}(?<!-)(\.(?!-)[A-Za-z0-9-]{1,63}(?<!-))*\.?$")
+
+
+def _is_valid_endpoint(ip: object, port: object) -> bool:
+    """Cheap syntactic check that ip is an IP address or hostname and port is 1-65535."""
+    if not isinstance(port, int) or isinstance(port, bool) or not 1 <= port <= 65535:
+        return False
+    if not isinstance(ip, str) or not ip:
+        return False
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return bool(_HOSTNAME_RE.match(ip))
+
+
+@functools.lru_cache(maxsize=256)
+def _health_url(ip: str, port: int) -> URL:
+    """Build (once per endpoint) the pre-parsed health-check URL for ip:port."""
+    return URL.build(scheme="http", host=ip, port=port, path="/api/health")
+
+
+# Sample values for every supported placeholder, used to validate templates when they are set.
+SAMPLE_PLACEHOLDERS = {
+    "name": "TestServer",
+    "ip": "127.0.0.1",
+    "port": 1234,
+    "status": "online",
+    "prev_status": "offline",
+    "timestamp": "2023-01-01 00:00:00",
+    "discord_short": "<t:1234567890:t>",
+    "discord_relative": "<t:1234567890:R>",
+}
+
+# Placeholder value and display label for each last_status (None means not yet checked).
+STATUS_NAMES = {None: "unknown", True: "online", False: "offline"}
+STATUS_LABELS = {None: "Unknown", True: "Online", False: "Offline"}
+
+PROBE_INTERVAL = 60.0  # Seconds between probes of the same realm.
+PROBE_JITTER = 3.0     # Random +/- spread applied to each realm's next probe time.
+MAX_PROBE_INTERVAL = 480.0  # Ceiling for a realm's probe interval while its probes keep failing.
+IDLE_SLEEP = 30.0           # Status loop sleep while monitoring is off or nothing is enabled.
+PROBE_BATCH_TIMEOUT = 30.0  # Upper bound for one gathered batch of probes.
+SEND_TIMEOUT = 15.0         # Upper bound for posting one update's Discord messages.
+BULK_DELETE_MAX_AGE = 14 * 24 * 3600 - 60  # Discord only bulk-deletes messages younger than 14 days.
+RESOLVE_TIMEOUT = 5.0       # Upper bound for resolving a hostname passed to the add command.
+
+
+@dataclass
+class Realm:
+    """In-memory state for a monitored realm; fields are updated in place."""
+    __slots__ = ("ip", "port", "last_status", "enabled")
+    ip: str
+    port: int
+    last_status: Optional[bool]
+    enabled: bool
+
+
 class AGSServerStatus(commands.Cog):
     """Cog that monitors MMORPG server statuses using a REST health-check endpoint.
     
@@ -32,150 +183,625 @@ class AGSServerStatus(commands.Cog):
             "status_channel": None, # Stored as channel ID
             "status_messages": {},  # { "online": message, "offline": message }
             "active": True,         # Overall toggle
-            "last_messages": {}     # Persisted mapping of realm -> message ID
+            "last_messages": {},    # Persisted mapping of realm -> message ID
+            "confirmations": 3,     # Consecutive matching probes required before a status change is announced
+            "probe_mode": "http",   # "http" checks /api/health; "tcp" only checks that the port accepts connections
+            "announce_initial": False  # Whether a realm's first known status is announced by the periodic check
         }
         self.config = Config.get_conf(self, identifier=123456789012345678, force_registration=True)
         self.config.register_global(**default_global)
         # In-memory storage.
-        self.servers: dict[str, tuple[str, int, Optional[bool], bool]] = {}
+        self.servers: dict[str, Realm] = {}
+        # Names of realms with monitoring enabled, kept in sync with Realm.enabled.
+        self._enabled_names: set[str] = set()
+        # Bumped on every change to self.servers; keys the cached server lists used by list and view.
+        self._servers_rev: int = 0
+        self._server_list_cache: dict[bool, tuple[int, str]] = {}
         self.status_channel: Optional[int] = None
+        # Resolved status channel, looked up lazily by _get_channel.
+        self._channel_obj: Optional[discord.abc.Messageable] = None
         self.status_messages: dict[str, str] = {}
+        # Compiled render function for each custom message (see _compile_template).
+        self._compiled_messages: dict[str, Callable[[dict], str]] = {}
         self.active: bool = True
+        self.confirmations: int = 3
+        self.probe_mode: str = "http"
+        self.announce_initial: bool = False
+        # Candidate status and how many consecutive probes have agreed with it, per realm.
+        self._pending: dict[str, tuple[bool, int]] = {}
         # To track the last update message (per realm) so it can be updated – now persisted.
         self.last_messages: dict[str, int] = {}
-        self.session = aiohttp.ClientSession()
-        self.bot.loop.create_task(self.initialize_settings())
-        self.check_status_task.start()
+        # Per-endpoint probe bookkeeping below is only read and written on the probe thread.
+        # Conditional-request validators (ETag, Last-Modified) per (ip, port); in-memory only.
+        self._probe_meta: dict[tuple[str, int], tuple[Optional[str], Optional[str]]] = {}
+        # Endpoints that answered HEAD with 405/501; these are probed with GET directly.
+        self._head_unsupported: set[tuple[str, int]] = set()
+        # Monotonic time at which each realm is next due to be probed by the status loop.
+        self._next_probe: dict[str, float] = {}
+        # Consecutive failed probes per realm; stretches that realm's probe interval.
+        self._fail_streak: dict[str, int] = {}
+        # Raw "servers" config mirrored in memory; written back by flush_task when dirty.
+        self._servers_cfg: dict[str, dict] = {}
+        self._dirty: set[str] = set()
+        # Realms whose entry under "servers" must be rewritten (or cleared) on the next flush.
+        self._dirty_realms: set[str] = set()
+        # Shared probe session, created on first use by _get_session (inside the probe loop).
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Dedicated event loop + thread that runs all health probes, isolated from the bot's loop.
+        self._probe_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._probe_thread: Optional[threading.Thread] = None
+        self._status_task: Optional[asyncio.Task] = None
+        # Set once cog_unload starts, so nothing restarts the status loop afterwards.
+        self._unloading: bool = False
+        # Serialises reset, which pauses and restarts the status loop.
+        self._reset_lock = asyncio.Lock()
+
+    async def cog_load(self) -> None:
+        # Load persisted state before anything can probe or write it back.
+        await self.initialize_settings()
+        self._start_probe_loop()
+        endpoints = {(realm.ip, realm.port) for realm in self.servers.values() if realm.enabled}
+        if endpoints:
+            # Fire and forget: warming must not hold up loading the cog.
+            asyncio.run_coroutine_threadsafe(self._warm_up(endpoints), self._probe_loop)
+        self._status_task = self.bot.loop.create_task(self._status_loop())
+        self.flush_task.start()
 
     async def initialize_settings(self) -> None:
         data = await self.config.all()
         servers = data.get("servers", {})
+        self._servers_cfg = servers
         for name, details in servers.items():
             ip = details.get("ip")
             port = details.get("port")
             last_status = details.get("last_status", None)
             enabled = details.get("enabled", True)
-            self.servers[name] = (ip, port, last_status, enabled)
+            if enabled and not _is_valid_endpoint(ip, port):
+                # Stop probing entries that can never succeed instead of timing out forever.
+                logger.warning("Disabling server %s: invalid address %s:%s", name, ip, port)
+                enabled = False
+                details["enabled"] = False
+                self._mark_realm_dirty(name)
+            self.servers[name] = Realm(ip, port, last_status, enabled)
+            if enabled:
+                self._enabled_names.add(name)
+        self._servers_rev += 1
         self.status_channel = data.get("status_channel")
         self.status_messages = data.get("status_messages", {})
+        self._compile_messages()
         self.active = data.get("active", True)
-        self.last_messages = data.get("last_messages", {})
+        self.confirmations = data.get("confirmations", 3)
+        self.probe_mode = data.get("probe_mode", "http")
+        self.announce_initial = data.get("announce_initial", False)
+        last_messages = data.get("last_messages", {})
+        # Handles are keyed by realm, so they are bounded by the server list; drop any orphans.
+        self.last_messages = {name: msg_id for name, msg_id in last_messages.items() if name in self.servers}
+        if len(self.last_messages) != len(last_messages):
+            self._mark_dirty("last_messages")
         logger.info("Initialized settings for AGSServerStatus.")
 
-    def cog_unload(self) -> None:
-        self.check_status_task.cancel()
-        if not self.session.closed:
-            self.bot.loop.create_task(self.session.close())
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared probe session, building it on first use. Connections are kept
+        alive for five minutes between probes, DNS answers are cached for ten minutes, and the
+        aiodns-backed AsyncResolver is used when aiodns is installed.
+        """
+        if self.session is None or self.session.closed:
+            resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=4,
+                keepalive_timeout=300,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                resolver=resolver,
+            )
+            self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=5))
+        return self.session
+
+    async def cog_unload(self) -> None:
+        self._unloading = True
+        if self._status_task:
+            self._status_task.cancel()
+            self._status_task = None
+        self.flush_task.cancel()
+        flush = self.flush_task.get_task()
+        if flush is not None:
+            # Let a flush that was mid-write unwind (and re-queue what it hadn't written) first.
+            await asyncio.gather(flush, return_exceptions=True)
+        if self._dirty or self._dirty_realms:
+            # Drain pending writes before the cog goes away instead of leaving an orphaned task.
+            await self._flush_config()
+        await self._stop_probe_loop()
         logger.info("Cog unloaded: session closed and task cancelled.")
 
-    @tasks.loop(minutes=1)
-    async def check_status_task(self) -> None:
-        """Periodic task that performs a status update for all enabled servers."""
-        if self.active:
-            logger.debug("Running periodic status update.")
-            await self.run_status_update()
+    def _start_probe_loop(self) -> None:
+        """Start the background thread whose event loop runs every health probe."""
+        if self._probe_loop is not None:
+            return
+        self._probe_loop = asyncio.new_event_loop()
+        self._probe_thread = threading.Thread(
+            target=self._run_probe_loop, args=(self._probe_loop,), name="AGSServerStatus-probes", daemon=True
+        )
+        self._probe_thread.start()
+
+    @staticmethod
+    def _run_probe_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Probe thread body: run the loop until stopped, then close it on this same thread."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _stop_probe_loop(self) -> None:
+        """
+        Shut the probe loop down without blocking the bot's loop: cancel in-flight probes and
+        close the session on the probe loop, then stop it and wait for its thread in a worker.
+        """
+        loop, thread = self._probe_loop, self._probe_thread
+        self._probe_loop = self._probe_thread = None
+        if loop is None:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._shutdown_probes(), loop)), timeout=5
+            )
+        except Exception as e:
+            logger.debug("Error shutting down probes: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            await asyncio.to_thread(thread.join, 5)
+            if thread.is_alive():
+                logger.warning("Probe thread did not stop within 5 seconds; it will close its loop on exit.")
 
-    @check_status_task.error
-    async def check_status_task_error(self, error: Exception) -> None:
-        logger.error("Error in check_status_task: %s", error)
+    async def _shutdown_probes(self) -> None:
+        """Runs on the probe loop: cancel and reap every other task there, then close the session."""
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def _clear_probe_state(self) -> None:
+        """
+        Forget per-endpoint probe bookkeeping. That state is only ever touched on the probe
+        thread, so the clear is scheduled there rather than done from the bot's loop.
+        """
+        def clear() -> None:
+            self._probe_meta.clear()
+            self._head_unsupported.clear()
+
+        if self._probe_loop is None:
+            clear()
+        else:
+            self._probe_loop.call_soon_threadsafe(clear)
+
+    async def _warm_up(self, endpoints: set[tuple[str, int]]) -> None:
+        """
+        Runs on the probe loop. Resolves every endpoint and, in http mode, opens a pooled
+        connection to each so the first real probe cycle doesn't pay DNS/TCP setup.
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.getaddrinfo(ip, port, type=socket.SOCK_STREAM) for ip, port in endpoints),
+            return_exceptions=True,
+        )
+        if self.probe_mode != "http":
+            return
+        warm_timeout = aiohttp.ClientTimeout(total=2)
+        # Same request path as a real probe, so endpoints known to reject HEAD get GET directly.
+        await asyncio.gather(
+            *(self._http_request((ip, port), _health_url(ip, port), {}, warm_timeout) for ip, port in endpoints),
+            return_exceptions=True,
+        )
+        logger.debug("Warmed %d probe endpoints.", len(endpoints))
+
+    def _probe(self, ip: str, port: int) -> "asyncio.Future[bool]":
+        """
+        Run is_server_online on the probe thread and return an awaitable for the bot's loop.
+        Cancelling the returned future cancels the probe.
+        """
+        if self._probe_loop is None:
+            return asyncio.ensure_future(self.is_server_online(ip, port))
+        return asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self.is_server_online(ip, port), self._probe_loop)
+        )
+
+    async def _status_loop(self) -> None:
+        """
+        Background loop that performs status updates for the enabled servers that are due.
+        Each realm is probed on its own jittered schedule, and the loop sleeps until the
+        next realm is due (or IDLE_SLEEP seconds while there is nothing to monitor).
+        """
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                if not self.active or not self._enabled_names or not self.status_channel:
+                    await asyncio.sleep(IDLE_SLEEP)
+                    continue
+                logger.debug("Running periodic status update.")
+                if await self.run_status_update(due_only=True):
+                    await asyncio.sleep(self._seconds_until_next_probe())
+                else:
+                    # E.g. the status channel can't be resolved; realms stay overdue, so don't spin.
+                    await asyncio.sleep(IDLE_SLEEP)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Error in status loop: %s", e)
+                await asyncio.sleep(IDLE_SLEEP)
+
+    def _probe_interval(self, name: str) -> float:
+        """
+        Seconds until a realm's next probe. Once a realm has failed more probes in a row than
+        the confirmation threshold (i.e. its outage has been announced), the interval doubles
+        with each further failure, up to MAX_PROBE_INTERVAL.
+        """
+        extra = self._fail_streak.get(name, 0) - self.confirmations
+        if extra <= 0:
+            return PROBE_INTERVAL
+        return min(PROBE_INTERVAL * (2 ** min(extra, 10)), MAX_PROBE_INTERVAL)
+
+    def _seconds_until_next_probe(self) -> float:
+        """Time until the earliest enabled realm is due, clamped to [1, IDLE_SLEEP]."""
+        now = time.monotonic()
+        due = min((self._next_probe.get(name, now) for name in self._enabled_names), default=now + IDLE_SLEEP)
+        return min(max(due - now, 1.0), IDLE_SLEEP)
+
+    @tasks.loop(seconds=10)
+    async def flush_task(self) -> None:
+        """Periodic task that persists any config changes made since the last flush."""
+        await self._flush_config()
+
+    @flush_task.error
+    async def flush_task_error(self, error: Exception) -> None:
+        logger.error("Error in flush_task: %s", error)
+
+    def _mark_realm_dirty(self, name: str) -> None:
+        """Flag a single realm's persisted entry as changed (or removed)."""
+        self._dirty_realms.add(name)
+
+    def _mark_dirty(self, *keys: str) -> None:
+        """Flag config groups whose in-memory copy has changed and needs persisting."""
+        self._dirty.update(keys)
+
+    async def _flush_config(self) -> None:
+        """
+        Write every dirty config group back to Config in one pass. Realms are written
+        individually with set_raw/clear_raw so one change doesn't reserialize all servers.
+        Anything not written (a failed write, or the flush being cancelled) is re-queued.
+        """
+        if self._dirty_realms:
+            realms, self._dirty_realms = self._dirty_realms, set()
+            unwritten = set(realms)
+            try:
+                for name in realms:
+                    try:
+                        details = self._servers_cfg.get(name)
+                        if details is None:
+                            await self.config.servers.clear_raw(name)
+                        else:
+                            await self.config.servers.set_raw(name, value=details)
+                        unwritten.discard(name)
+                    except Exception as e:
+                        logger.error("Failed to persist server %s: %s", name, e)
+            finally:
+                self._dirty_realms |= unwritten
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        unwritten_keys = set(dirty)
+        values = {
+            "status_messages": self.status_messages,
+            "last_messages": self.last_messages,
+        }
+        try:
+            for key in dirty:
+                try:
+                    await self.config.get_attr(key).set(values[key])
+                    unwritten_keys.discard(key)
+                except Exception as e:
+                    logger.error("Failed to persist %s: %s", key, e)
+        finally:
+            self._dirty |= unwritten_keys
+        logger.debug("Flushed config groups: %s", ", ".join(sorted(dirty - unwritten_keys)))
+
+    def _get_channel(self) -> Optional[discord.abc.Messageable]:
+        """Return the status channel, resolving and caching it on first use."""
+        if self._channel_obj is None and self.status_channel:
+            self._channel_obj = self.bot.get_channel(self.status_channel)
+        return self._channel_obj
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        if channel.id == self.status_channel:
+            self._channel_obj = None
 
     async def is_server_online(self, ip: str, port: int, timeout: int = 5) -> bool:
+        """
+        Check whether the server is up using the configured probe mode.
+        Returns True if healthy, else False.
+        """
+        if self.probe_mode == "tcp":
+            return await self._tcp_probe(ip, port, timeout)
+        return await self._http_probe(ip, port, timeout)
+
+    async def _tcp_probe(self, ip: str, port: int, timeout: int = 5) -> bool:
+        """
+        Check that the server accepts a TCP connection on the given port.
+        Cheaper than the HTTP probe, but says nothing about the health endpoint itself.
+        """
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.debug("Timed out connecting to server %s:%s", ip, port)
+            return False
+        except OSError as e:
+            logger.debug("Error connecting to server %s:%s - %s", ip, port, e)
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+    async def _http_probe(self, ip: str, port: int, timeout: int = 5) -> bool:
         """
         Check the health endpoint of the server.
         Expects a healthy server to return status 200 at http://<ip>:<port>/api/health.
+        A HEAD request is tried first (falling back to GET if the server rejects it), and
+        any ETag/Last-Modified validators are replayed so a 304 also counts as healthy.
+        The whole check, including any fallback request, is capped at timeout seconds.
         Returns True if healthy, else False.
         """
-        health_url = f"http://{ip}:{port}/api/health"
+        health_url = _health_url(ip, port)
+        key = (ip, port)
+        headers = {}
+        etag, last_modified = self._probe_meta.get(key, (None, None))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        client_timeout = aiohttp.ClientTimeout(
+            total=timeout,
+            connect=min(2, timeout),
+            sock_connect=min(2, timeout),
+            sock_read=timeout,
+        )
         try:
-            async with self.session.get(health_url, timeout=timeout) as response:
-                return response.status == 200
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status, response_headers = await asyncio.wait_for(
+                self._http_request(key, health_url, headers, client_timeout), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.debug("Timed out checking server %s:%s", ip, port)
+            return False
+        except (aiohttp.ClientError, OSError) as e:
             logger.debug("Error checking server %s:%s - %s", ip, port, e)
             return False
+        if status == 200:
+            etag = response_headers.get("ETag")
+            last_modified = response_headers.get("Last-Modified")
+            if etag or last_modified:
+                self._probe_meta[key] = (etag, last_modified)
+            else:
+                self._probe_meta.pop(key, None)
+        return status in (200, 304)
+
+    async def _http_request(
+        self, key: tuple[str, int], url: URL, headers: dict[str, str], client_timeout: aiohttp.ClientTimeout
+    ) -> tuple[int, Mapping[str, str]]:
+        """
+        Send HEAD to the health URL, retrying with GET on 405/501; return status and headers.
+        Endpoints that rejected HEAD once are remembered and sent GET straight away.
+        """
+        session = self._get_session()
+        if key not in self._head_unsupported:
+            async with session.head(url, headers=headers, allow_redirects=False, timeout=client_timeout) as response:
+                status, response_headers = response.status, response.headers
+            if status not in (405, 501):
+                return status, response_headers
+            self._head_unsupported.add(key)
+        async with session.get(url, headers=headers, allow_redirects=False, timeout=client_timeout) as response:
+            return response.status, response.headers
 
     async def _send_status_update(self, realm: str, channel: discord.TextChannel, content: str) -> None:
         """
         Sends a status update message.
-        If a previous message for the realm exists, attempts to edit it.
+        If a previous message for the realm exists, attempts to edit it in place
+        through a partial message, so it is never fetched first.
         If the message does not exist or editing fails, sends a new one
         and updates the persisted message ID.
         """
         if realm in self.last_messages:
             try:
-                old_msg = await channel.fetch_message(self.last_messages[realm])
-                await old_msg.edit(content=content)
+                await channel.get_partial_message(self.last_messages[realm]).edit(content=content)
                 return
             except (discord.NotFound, discord.HTTPException) as e:
                 logger.debug("Previous message for %s not found or not editable: %s", realm, e)
         try:
             new_msg = await channel.send(content)
             self.last_messages[realm] = new_msg.id
-            await self.config.last_messages.set(self.last_messages)
+            self._mark_dirty("last_messages")
         except Exception as e:
             logger.error("Failed to send status update for %s: %s", realm, e)
 
-    def _validate_format(self, message_text: str) -> bool:
+    async def _send_status_batch(
+        self, channel: discord.TextChannel, transitions: list[tuple[str, str]], timestamp: str
+    ) -> None:
+        """
+        Sends every transition from one update as a single embed (one field per realm),
+        split across several embeds only if Discord's field or size limits are exceeded.
+        Embeds are packed into as few messages as the limits allow.
+        The realms' previous per-realm messages are superseded by the batch, so they
+        are deleted and the next individual update is posted as a new message.
+        """
+        embeds: list[discord.Embed] = []
+        title = f"Server status update ({timestamp})"
+        for name, message in transitions:
+            _add_embed_field(embeds, title, name, message)
+        for group in _group_embeds(embeds):
+            try:
+                await channel.send(embeds=group)
+            except Exception as e:
+                logger.error("Failed to send batched status update: %s", e)
+                return
+        stale = [self.last_messages.pop(name) for name, _ in transitions if name in self.last_messages]
+        if stale:
+            self._mark_dirty("last_messages")
+            await self._delete_messages(channel, stale)
+
+    @staticmethod
+    async def _delete_messages(channel: discord.TextChannel, message_ids: list[int]) -> None:
+        """
+        Deletes the given messages, using one bulk-delete request where Discord allows it
+        (two or more messages under 14 days old, and Manage Messages permission).
+        Anything else is deleted individually; those deletes are scheduled with delay=0 so
+        they run concurrently in the background, and ones that fail (already gone) are ignored.
+        """
+        cutoff = time.time() - BULK_DELETE_MAX_AGE
+        recent = [m for m in message_ids if discord.utils.snowflake_time(m).timestamp() > cutoff]
+        single = [m for m in message_ids if m not in recent]
+        can_bulk = isinstance(channel, discord.TextChannel) and channel.permissions_for(channel.guild.me).manage_messages
+        if can_bulk and len(recent) >= 2:
+            try:
+                await channel.delete_messages([discord.Object(id=m) for m in recent])
+            except discord.HTTPException as e:
+                logger.debug("Bulk delete of previous status messages failed: %s", e)
+        else:
+            single.extend(recent)
+        for message_id in single:
+            await channel.get_partial_message(message_id).delete(delay=0)
+
+    @staticmethod
+    def _format_error(message_text: str) -> Optional[str]:
         """
-        Validates the custom message using dummy placeholder values.
-        Includes the new Discord timestamp placeholders.
+        Return why a custom message can't be used, or None if it is valid.
+        The template is parsed once and every placeholder is checked against the known names;
+        only placeholders with a format spec, conversion or attribute access are test-rendered.
+        This only proves the template works with the sample values (e.g. {name[5]} passes here
+        but fails for a shorter real name), so _apply_transition still guards the render.
         """
         try:
-            message_text.format(
-                name="TestServer",
-                ip="127.0.0.1",
-                port=1234,
-                status="online",
-                prev_status="offline",
-                timestamp="2023-01-01 00:00:00",
-                discord_short="<t:1234567890:t>",
-                discord_relative="<t:1234567890:R>"
-            )
-            return True
-        except Exception as e:
-            logger.error("Format validation error: %s", e)
-            return False
+            fields = [(f, spec, conv) for _, f, spec, conv in _FORMATTER.parse(message_text) if f is not None]
+        except ValueError as e:
+            return str(e)
+        for field, spec, conversion in fields:
+            root = field.partition(".")[0].partition("[")[0]
+            if root not in SAMPLE_PLACEHOLDERS:
+                return f"unknown placeholder {{{root}}}"
+            if field != root or spec or conversion:
+                try:
+                    _compile_field(field, spec, conversion)(SAMPLE_PLACEHOLDERS)
+                except (KeyError, IndexError, ValueError, AttributeError, TypeError) as e:
+                    return f"invalid placeholder {{{field}}}: {e}"
+        return None
+
+    @staticmethod
+    def _timestamps() -> tuple[str, str, str]:
+        """Return the local timestamp string plus Discord short/relative tags for now."""
+        ts = int(time.time())
+        # Local time, formatted from a struct_time to skip building a datetime.
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)), f"<t:{ts}:t>", f"<t:{ts}:R>"
+
+    def _compile_messages(self) -> None:
+        """
+        Compile every custom message once so rendering doesn't re-tokenize it per update.
+        Stored templates that no longer validate are skipped, so the default message is used.
+        """
+        self._compiled_messages = {}
+        for kind, template in self.status_messages.items():
+            error = self._format_error(template)
+            if error:
+                logger.warning("Ignoring invalid custom %s message (%s); the default will be used.", kind, error)
+                continue
+            self._compiled_messages[kind] = _compile_template(template)
+
+    def _apply_transition(self, name: str, realm: Realm, new_status: bool, stamps: tuple[str, str, str]) -> str:
+        """
+        Record a realm's new status and return the rendered announcement for it.
+        stamps is the (timestamp, discord_short, discord_relative) tuple from _timestamps.
+        """
+        current_status = STATUS_NAMES[new_status]
+        timestamp_str, discord_short, discord_relative = stamps
+        # Most setups never set a custom message; only build placeholder values when one exists.
+        compiled = self._compiled_messages.get(current_status) if self._compiled_messages else None
+        message = None
+        if compiled is not None:
+            try:
+                message = compiled({
+                    "name": name,
+                    "ip": realm.ip,
+                    "port": realm.port,
+                    "status": current_status,
+                    "prev_status": STATUS_NAMES[realm.last_status],
+                    "timestamp": timestamp_str,
+                    "discord_short": discord_short,
+                    "discord_relative": discord_relative,
+                })
+            except (KeyError, IndexError, ValueError, AttributeError, TypeError) as e:
+                # Validation only used sample values; a real value can still break the template.
+                logger.warning("Custom %s message failed for %s (%s); using the default.", current_status, name, e)
+        if message is None:
+            message = f"Server {name} is now {current_status}. {discord_short} {discord_relative}"
+        self._record_status(name, realm, new_status)
+        logger.info("Status update for %s: %s", name, current_status)
+        return message
+
+    def _record_status(self, name: str, realm: Realm, new_status: bool) -> None:
+        """Store a realm's new status in memory and queue it for persistence."""
+        realm.last_status = new_status
+        self._servers_rev += 1
+        if name in self._servers_cfg:
+            self._servers_cfg[name]["last_status"] = new_status
+            self._mark_realm_dirty(name)
 
     async def _set_custom_message(self, kind: str, message_text: Optional[str], ctx: commands.Context) -> None:
         """
         Set or view a custom message for the given kind ("online" or "offline").
         Validates the formatting before saving.
         """
-        if message_text:
-            if not self._validate_format(message_text):
-                await ctx.send("The provided message formatting is invalid. Please check your placeholders.")
-                return
-            self.status_messages[kind] = message_text
-            current_messages = await self.config.status_messages()
-            current_messages[kind] = message_text
-            await self.config.status_messages.set(current_messages)
-            await ctx.send(f"Custom message for {kind} status updated.")
-        elif ctx.message.reference:
+        source = ""
+        if not message_text and ctx.message.reference:
             try:
-                ref_msg = await ctx.channel.fetch_message(ctx.message.reference.message_id)
+                ref_msg = ctx.message.reference.resolved
+                if not isinstance(ref_msg, discord.Message):
+                    # Not cached (or deleted); fall back to an API fetch.
+                    ref_msg = await ctx.channel.fetch_message(ctx.message.reference.message_id)
             except Exception as e:
                 logger.error("Failed to fetch referenced message: %s", e)
                 return await ctx.send("Failed to fetch the referenced message.")
-            if not self._validate_format(ref_msg.content):
-                await ctx.send("The referenced message has invalid formatting placeholders.")
-                return
-            self.status_messages[kind] = ref_msg.content
-            current_messages = await self.config.status_messages()
-            current_messages[kind] = ref_msg.content
-            await self.config.status_messages.set(current_messages)
-            await ctx.send(f"Custom message for {kind} status updated from referenced message.")
-        else:
+            message_text = ref_msg.content
+            source = " from referenced message"
+        if not message_text:
             current = self.status_messages.get(kind)
             if current:
                 await ctx.send(f"Current custom message for {kind}: {current}")
             else:
                 await ctx.send(f"No custom message set for {kind} status.")
+            return
+        error = self._format_error(message_text)
+        if error:
+            placeholders = ", ".join(f"{{{key}}}" for key in SAMPLE_PLACEHOLDERS)
+            await ctx.send(
+                f"The provided message formatting is invalid ({error}). Available placeholders: {placeholders}"
+            )
+            return
+        self.status_messages[kind] = message_text
+        self._compile_messages()
+        self._mark_dirty("status_messages")
+        await ctx.send(f"Custom message for {kind} status updated{source}.")
 
     @commands.group(invoke_without_command=True)
     async def serverstatus(self, ctx: commands.Context) -> None:
         """
         Manage the monitoring of game servers.
-        Subcommands include: add, remove, list, togglerealm, setchannel, setmessage, toggle, view, formatting,
-        instructions, and reset.
+        Subcommands include: add, remove, list, togglerealm, setchannel, setmessage, toggle, confirmations,
+        probemode, announceinitial, view, formatting, instructions, and reset.
         """
         await ctx.send_help(ctx.command)
 
@@ -188,10 +814,29 @@ class AGSServerStatus(commands.Cog):
           [p]serverstatus add Avalon 192.168.1.1 5757
           [p]serverstatus add "Public Test Realm" 192.168.1.2 5757
         """
-        self.servers[name] = (ip, port, None, True)
-        current_servers = await self.config.servers()
-        current_servers[name] = {"ip": ip, "port": port, "enabled": True, "last_status": None}
-        await self.config.servers.set(current_servers)
+        if not 1 <= port <= 65535:
+            return await ctx.send("Invalid port. It must be between 1 and 65535.")
+        if not _is_valid_endpoint(ip, port):
+            return await ctx.send("Invalid address. Use an IP address or hostname.")
+        try:
+            ipaddress.ip_address(ip)
+        except ValueError:
+            try:
+                await asyncio.wait_for(
+                    asyncio.get_running_loop().getaddrinfo(ip, port, type=socket.SOCK_STREAM),
+                    timeout=RESOLVE_TIMEOUT,
+                )
+            except (OSError, asyncio.TimeoutError):
+                return await ctx.send(f"Could not resolve {ip}. Check the address and try again.")
+        self.servers[name] = Realm(ip, port, None, True)
+        self._enabled_names.add(name)
+        # Re-adding a name starts it fresh rather than inheriting the old realm's probe state.
+        self._next_probe.pop(name, None)
+        self._pending.pop(name, None)
+        self._fail_streak.pop(name, None)
+        self._servers_rev += 1
+        self._servers_cfg[name] = {"ip": ip, "port": port, "enabled": True, "last_status": None}
+        self._mark_realm_dirty(name)
         await ctx.send(f"Added server {name} at {ip}:{port}.")
         logger.info("Added server %s at %s:%d", name, ip, port)
 
@@ -201,13 +846,16 @@ class AGSServerStatus(commands.Cog):
         """Remove a monitored server."""
         if name in self.servers:
             del self.servers[name]
+            self._enabled_names.discard(name)
+            self._servers_rev += 1
+            self._next_probe.pop(name, None)
+            self._pending.pop(name, None)
+            self._fail_streak.pop(name, None)
             if name in self.last_messages:
                 del self.last_messages[name]
-                await self.config.last_messages.set(self.last_messages)
-            current_servers = await self.config.servers()
-            if name in current_servers:
-                del current_servers[name]
-                await self.config.servers.set(current_servers)
+                self._mark_dirty("last_messages")
+            self._servers_cfg.pop(name, None)
+            self._mark_realm_dirty(name)
             await ctx.send(f"Removed server {name}.")
             logger.info("Removed server %s", name)
         else:
@@ -219,16 +867,9 @@ class AGSServerStatus(commands.Cog):
         if not self.servers:
             await ctx.send("No servers are being monitored.")
             return
-        lines = []
-        for name, (ip, port, status, enabled) in self.servers.items():
-            status_text = "Unknown"
-            if status is True:
-                status_text = "Online"
-            elif status is False:
-                status_text = "Offline"
-            lines.append(f"{name} - {ip}:{port} - {status_text} - {'Enabled' if enabled else 'Disabled'}")
-        message = "**Monitored Servers:**\n" + "\n".join(lines)
-        await ctx.send(message)
+        message = "**Monitored Servers:**\n" + self._server_list(bold=False)
+        for page in pagify(message, page_length=1900):
+            await ctx.send(page)
 
     @serverstatus.command()
     @commands.cooldown(1, 5, commands.BucketType.user)
@@ -240,7 +881,7 @@ class AGSServerStatus(commands.Cog):
         """
         if name not in self.servers:
             return await ctx.send("Server not found.")
-        ip, port, last_status, enabled = self.servers[name]
+        realm = self.servers[name]
         if state:
             state_lower = state.lower()
             if state_lower in ["on", "enable", "enabled"]:
@@ -250,56 +891,37 @@ class AGSServerStatus(commands.Cog):
             else:
                 return await ctx.send("Invalid state. Use on/off.")
         else:
-            new_enabled = not enabled
-        self.servers[name] = (ip, port, last_status, new_enabled)
-        current_servers = await self.config.servers()
-        if name in current_servers:
-            current_servers[name]["enabled"] = new_enabled
-            await self.config.servers.set(current_servers)
+            new_enabled = not realm.enabled
+        if new_enabled and not _is_valid_endpoint(realm.ip, realm.port):
+            return await ctx.send("Invalid address. Use an IP address or hostname.")
+        realm.enabled = new_enabled
+        self._servers_rev += 1
+        self._fail_streak.pop(name, None)
+        if new_enabled:
+            self._enabled_names.add(name)
+        else:
+            self._enabled_names.discard(name)
+        if name in self._servers_cfg:
+            self._servers_cfg[name]["enabled"] = new_enabled
+            self._mark_realm_dirty(name)
         await ctx.send(f"Monitoring for server {name} is now {'enabled' if new_enabled else 'disabled'}.")
         logger.info("Toggled realm %s to %s", name, "enabled" if new_enabled else "disabled")
         
         if new_enabled and self.status_channel:
-            new_status_bool = await self.is_server_online(ip, port)
-            if last_status is not None and new_status_bool == last_status:
+            new_status_bool = await self._probe(realm.ip, realm.port)
+            if realm.last_status is not None and new_status_bool == realm.last_status:
                 return
-            current_status = "online" if new_status_bool else "offline"
-            prev_status = "unknown" if last_status is None else ("online" if last_status else "offline")
-            now = datetime.now()  # Use local time now instead of UTC
-            ts = int(now.timestamp())
-            timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
-            discord_short = f"<t:{ts}:t>"
-            discord_relative = f"<t:{ts}:R>"
-            default_message = f"Server {name} is now {current_status}. {discord_short} {discord_relative}"
-            message_template = self.status_messages.get(current_status, default_message)
-            try:
-                message = message_template.format(
-                    name=name,
-                    ip=ip,
-                    port=port,
-                    status=current_status,
-                    prev_status=prev_status,
-                    timestamp=timestamp_str,
-                    discord_short=discord_short,
-                    discord_relative=discord_relative,
-                )
-            except Exception as e:
-                logger.error("Error formatting message for %s: %s", name, e)
-                message = default_message
-            channel = self.bot.get_channel(self.status_channel)
+            message = self._apply_transition(name, realm, new_status_bool, self._timestamps())
+            channel = self._get_channel()
             if channel:
                 await self._send_status_update(name, channel, message)
-            self.servers[name] = (ip, port, new_status_bool, new_enabled)
-            current_servers = await self.config.servers()
-            if name in current_servers:
-                current_servers[name]["last_status"] = new_status_bool
-                await self.config.servers.set(current_servers)
 
     @serverstatus.command()
     @commands.cooldown(1, 5, commands.BucketType.user)
     async def setchannel(self, ctx: commands.Context, channel: discord.TextChannel) -> None:
         """Set the channel where status update messages will be posted."""
         self.status_channel = channel.id
+        self._channel_obj = channel
         await self.config.status_channel.set(channel.id)
         await ctx.send(f"Status updates will be posted in {channel.mention}.")
         logger.info("Set status channel to %s", channel.id)
@@ -347,51 +969,181 @@ class AGSServerStatus(commands.Cog):
         if self.active:
             await self.run_status_update()
 
-    async def run_status_update(self) -> None:
+    @serverstatus.command()
+    @commands.cooldown(1, 5, commands.BucketType.user)
+    async def confirmations(self, ctx: commands.Context, count: Optional[int] = None) -> None:
+        """
+        Set or view how many consecutive probes must agree before a status change is announced.
+        Usage: [p]serverstatus confirmations [1-10]
+        A value of 1 announces every change immediately.
+        """
+        if count is None:
+            return await ctx.send(f"Status changes require {self.confirmations} consecutive matching checks.")
+        if not 1 <= count <= 10:
+            return await ctx.send("Confirmations must be between 1 and 10.")
+        self.confirmations = count
+        self._pending.clear()
+        await self.config.confirmations.set(count)
+        await ctx.send(f"Status changes now require {count} consecutive matching checks.")
+        logger.info("Set confirmations to %d", count)
+
+    @serverstatus.command()
+    @commands.cooldown(1, 5, commands.BucketType.user)
+    async def probemode(self, ctx: commands.Context, mode: Optional[str] = None) -> None:
+        """
+        Set or view how servers are checked.
+        Usage: [p]serverstatus probemode [http/tcp]
+          • http - request /api/health and require a 200 response (default)
+          • tcp  - only check that the port accepts connections
+        """
+        if mode is None:
+            return await ctx.send(f"Servers are currently checked with the `{self.probe_mode}` probe.")
+        mode = mode.lower()
+        if mode not in ("http", "tcp"):
+            return await ctx.send("Invalid mode. Use http or tcp.")
+        self.probe_mode = mode
+        await self.config.probe_mode.set(mode)
+        await ctx.send(f"Servers will now be checked with the `{mode}` probe.")
+        logger.info("Set probe mode to %s", mode)
+
+    @serverstatus.command()
+    @commands.cooldown(1, 5, commands.BucketType.user)
+    async def announceinitial(self, ctx: commands.Context, state: Optional[str] = None) -> None:
+        """
+        Set or view whether a realm's first known status is announced.
+        Usage: [p]serverstatus announceinitial [on/off]
+        When off (the default), the periodic check records a new realm's first status silently
+        and only announces later changes.
+        """
+        if state is None:
+            return await ctx.send(f"Initial statuses are {'announced' if self.announce_initial else 'recorded silently'}.")
+        state_lower = state.lower()
+        if state_lower in ["on", "enable", "enabled"]:
+            self.announce_initial = True
+        elif state_lower in ["off", "disable", "disabled"]:
+            self.announce_initial = False
+        else:
+            return await ctx.send("Invalid state. Use on/off.")
+        await self.config.announce_initial.set(self.announce_initial)
+        await ctx.send(f"Initial statuses will now be {'announced' if self.announce_initial else 'recorded silently'}.")
+        logger.info("Set announce_initial to %s", self.announce_initial)
+
+    async def run_status_update(self, due_only: bool = False) -> bool:
         """
         Immediately checks the status for all enabled servers and sends updates
         if the state has changed.
+        With due_only, only realms whose scheduled probe time has passed are checked;
+        realms seen for the first time are given a random slot within PROBE_INTERVAL.
+        Returns False if nothing could be scheduled (no channel or nothing enabled), so the
+        status loop can back off instead of waking for realms that stay overdue.
         """
         if not self.status_channel:
-            return
-        channel = self.bot.get_channel(self.status_channel)
+            return False
+        channel = self._get_channel()
         if not channel:
-            return
-        for name, (ip, port, last_status, enabled) in list(self.servers.items()):
-            if not enabled:
+            return False
+        if not self._enabled_names:
+            return False
+        now = time.monotonic()
+        names: list[str] = []
+        for name in self._enabled_names:
+            if due_only:
+                due = self._next_probe.get(name)
+                if due is None:
+                    self._next_probe[name] = now + random.uniform(0, PROBE_INTERVAL)
+                    continue
+                if now < due:
+                    continue
+            self._next_probe[name] = now + self._probe_interval(name) + random.uniform(-PROBE_JITTER, PROBE_JITTER)
+            names.append(name)
+        if not names:
+            return True
+        # Realms that share an ip:port are probed once and all receive the same result.
+        realms = [self.servers[name] for name in names]
+        targets = [(realm.ip, realm.port) for realm in realms]
+        endpoints = list(dict.fromkeys(targets))
+        # Probe all endpoints concurrently so one slow host can't delay the others.
+        try:
+            endpoint_results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(self._probe(ip, port) for ip, port in endpoints),
+                    return_exceptions=True,
+                ),
+                timeout=PROBE_BATCH_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Status probes did not complete within %s seconds; skipping this update.", PROBE_BATCH_TIMEOUT)
+            return True
+        by_endpoint = dict(zip(endpoints, endpoint_results))
+        # Drop realms removed, replaced or disabled while the probes were in flight so their
+        # results don't seed state for whatever holds the name now.
+        live = [
+            (name, realm, by_endpoint[target])
+            for name, realm, target in zip(names, realms, targets)
+            if self.servers.get(name) is realm and name in self._enabled_names
+        ]
+        for name, _, result in live:
+            if result is True:
+                self._fail_streak.pop(name, None)
+            else:
+                self._fail_streak[name] = self._fail_streak.get(name, 0) + 1
+        # Timestamps are built on the first transition and shared by the rest of this tick.
+        stamps: Optional[tuple[str, str, str]] = None
+        transitions: list[tuple[str, str]] = []
+        for name, realm, new_status in live:
+            if isinstance(new_status, Exception):
+                logger.error("Error checking server %s: %s", name, new_status)
                 continue
-            new_status = await self.is_server_online(ip, port)
-            if last_status is None or new_status != last_status:
-                current_status = "online" if new_status else "offline"
-                previous_status = "unknown" if last_status is None else ("online" if last_status else "offline")
-                now = datetime.now()  # Use local time now
-                ts = int(now.timestamp())
-                timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
-                discord_short = f"<t:{ts}:t>"
-                discord_relative = f"<t:{ts}:R>"
-                default_message = f"Server {name} is now {current_status}. {discord_short} {discord_relative}"
-                message_template = self.status_messages.get(current_status, default_message)
-                try:
-                    message = message_template.format(
-                        name=name,
-                        ip=ip,
-                        port=port,
-                        status=current_status,
-                        prev_status=previous_status,
-                        timestamp=timestamp_str,
-                        discord_short=discord_short,
-                        discord_relative=discord_relative,
-                    )
-                except Exception as e:
-                    logger.error("Error formatting message for %s: %s", name, e)
-                    message = default_message
-                await self._send_status_update(name, channel, message)
-                self.servers[name] = (ip, port, new_status, enabled)
-                current_servers = await self.config.servers()
-                if name in current_servers:
-                    current_servers[name]["last_status"] = new_status
-                    await self.config.servers.set(current_servers)
-                logger.info("Status update for %s: %s", name, current_status)
+            last_status = realm.last_status
+            if new_status == last_status:
+                # Fast path: nothing changed, so nothing is rendered or sent.
+                self._pending.pop(name, None)
+                continue
+            if last_status is None:
+                if not self.announce_initial:
+                    # Seed the first known status silently.
+                    self._record_status(name, realm, new_status)
+                    continue
+            else:
+                # Hysteresis: only announce once enough consecutive probes agree.
+                candidate, count = self._pending.get(name, (new_status, 0))
+                count = count + 1 if candidate == new_status else 1
+                if count < self.confirmations:
+                    self._pending[name] = (new_status, count)
+                    continue
+                self._pending.pop(name, None)
+            if stamps is None:
+                stamps = self._timestamps()
+            transitions.append((name, self._apply_transition(name, realm, new_status, stamps)))
+        if not transitions:
+            return True
+        if len(transitions) == 1:
+            name, message = transitions[0]
+            send = self._send_status_update(name, channel, message)
+        else:
+            send = self._send_status_batch(channel, transitions, stamps[0])
+        try:
+            await asyncio.wait_for(send, timeout=SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Sending status updates did not complete within %s seconds.", SEND_TIMEOUT)
+        return True
+
+    def _server_list(self, bold: bool) -> str:
+        """
+        Return one line per server for list (plain names) or view (bold names), built in a
+        single join and rebuilt only after the servers change.
+        """
+        rev, cached = self._server_list_cache.get(bold, (-1, ""))
+        if rev == self._servers_rev:
+            return cached
+        name_fmt = "**{}**" if bold else "{}"
+        rendered = "\n".join(
+            f"{name_fmt.format(name)} - {realm.ip}:{realm.port} - {STATUS_LABELS[realm.last_status]} - "
+            f"{'Enabled' if realm.enabled else 'Disabled'}"
+            for name, realm in self.servers.items()
+        )
+        self._server_list_cache[bold] = (self._servers_rev, rendered)
+        return rendered
 
     @serverstatus.command()
     async def view(self, ctx: commands.Context) -> None:
@@ -399,33 +1151,30 @@ class AGSServerStatus(commands.Cog):
         View all current settings, including overall monitoring state, the designated
         status channel, monitored servers, and custom messages.
         """
-        embed = discord.Embed(title="AGSServerStatus Settings", color=discord.Color.blue())
-        embed.add_field(name="Overall Monitoring", value="Enabled" if self.active else "Disabled", inline=False)
+        title = "AGSServerStatus Settings"
+        embeds: list[discord.Embed] = []
+        _add_embed_field(embeds, title, "Overall Monitoring", "Enabled" if self.active else "Disabled")
+        _add_embed_field(embeds, title, "Confirmations", str(self.confirmations))
+        _add_embed_field(embeds, title, "Probe Mode", self.probe_mode.upper())
+        _add_embed_field(embeds, title, "Announce Initial Status", "Enabled" if self.announce_initial else "Disabled")
         if self.status_channel:
-            channel = self.bot.get_channel(self.status_channel)
-            embed.add_field(name="Status Channel", value=channel.mention if channel else f"ID: {self.status_channel}", inline=False)
+            channel = self._get_channel()
+            _add_embed_field(embeds, title, "Status Channel", channel.mention if channel else f"ID: {self.status_channel}")
         else:
-            embed.add_field(name="Status Channel", value="Not set", inline=False)
+            _add_embed_field(embeds, title, "Status Channel", "Not set")
         if self.servers:
-            server_lines = []
-            for name, (ip, port, status, enabled) in self.servers.items():
-                status_text = "Unknown"
-                if status is True:
-                    status_text = "Online"
-                elif status is False:
-                    status_text = "Offline"
-                server_lines.append(f"**{name}** - {ip}:{port} - {status_text} - {'Enabled' if enabled else 'Disabled'}")
-            embed.add_field(name="Monitored Servers", value="\n".join(server_lines), inline=False)
+            _add_embed_field(embeds, title, "Monitored Servers", self._server_list(bold=True))
         else:
-            embed.add_field(name="Monitored Servers", value="No servers have been added.", inline=False)
+            _add_embed_field(embeds, title, "Monitored Servers", "No servers have been added.")
         if self.status_messages:
             message_lines = []
             for key, msg in self.status_messages.items():
                 message_lines.append(f"**{key.title()}**: {msg}")
-            embed.add_field(name="Custom Status Messages", value="\n".join(message_lines), inline=False)
+            _add_embed_field(embeds, title, "Custom Status Messages", "\n".join(message_lines))
         else:
-            embed.add_field(name="Custom Status Messages", value="No custom messages set.", inline=False)
-        await ctx.send(embed=embed)
+            _add_embed_field(embeds, title, "Custom Status Messages", "No custom messages set.")
+        for group in _group_embeds(embeds):
+            await ctx.send(embeds=group)
 
     @serverstatus.command()
     async def formatting(self, ctx: commands.Context) -> None:
@@ -491,25 +1240,54 @@ class AGSServerStatus(commands.Cog):
         and the persisted message IDs.
         To confirm, type "I agree" within 60 seconds.
         """
-        await ctx.send("WARNING: This will wipe ALL settings including servers, custom messages, the set channel, and previous message IDs. "
-                       "Type 'I agree' within 60 seconds to confirm.")
-        try:
-            def check(m: discord.Message) -> bool:
-                return m.author == ctx.author and m.channel == ctx.channel and m.content.strip().lower() == "i agree"
-            await self.bot.wait_for("message", check=check, timeout=60)
-        except asyncio.TimeoutError:
-            return await ctx.send("Reset cancelled due to timeout.")
-        self.servers = {}
-        self.last_messages = {}
-        self.status_channel = None
-        self.status_messages = {}
-        self.active = True
-        await self.config.servers.set({})
-        await self.config.status_channel.set(None)
-        await self.config.status_messages.set({})
-        await self.config.active.set(True)
-        await self.config.last_messages.set({})
-        await ctx.send("All settings have been reset.")
+        if self._reset_lock.locked():
+            return await ctx.send("A reset is already waiting for confirmation.")
+        async with self._reset_lock:
+            await ctx.send("WARNING: This will wipe ALL settings including servers, custom messages, the set channel, and previous message IDs. "
+                           "Type 'I agree' within 60 seconds to confirm.")
+            # Pause probing while waiting for confirmation so no update races the wipe.
+            if self._status_task:
+                self._status_task.cancel()
+                await asyncio.gather(self._status_task, return_exceptions=True)
+            try:
+                try:
+                    def check(m: discord.Message) -> bool:
+                        return m.author == ctx.author and m.channel == ctx.channel and m.content.strip().lower() == "i agree"
+                    await self.bot.wait_for("message", check=check, timeout=60)
+                except asyncio.TimeoutError:
+                    return await ctx.send("Reset cancelled due to timeout.")
+                self.servers = {}
+                self._enabled_names = set()
+                self._servers_rev += 1
+                self._servers_cfg = {}
+                self._dirty.clear()
+                self._dirty_realms.clear()
+                self.last_messages = {}
+                self._clear_probe_state()
+                self._next_probe = {}
+                self._pending = {}
+                self._fail_streak = {}
+                self.status_channel = None
+                self._channel_obj = None
+                self.status_messages = {}
+                self._compiled_messages = {}
+                self.active = True
+                self.confirmations = 3
+                self.probe_mode = "http"
+                self.announce_initial = False
+                await self.config.servers.set({})
+                await self.config.status_channel.set(None)
+                await self.config.status_messages.set({})
+                await self.config.active.set(True)
+                await self.config.confirmations.set(3)
+                await self.config.probe_mode.set("http")
+                await self.config.announce_initial.set(False)
+                await self.config.last_messages.set({})
+                await ctx.send("All settings have been reset.")
+            finally:
+                # Don't resurrect the loop on an unloaded cog, or start a second one.
+                if not self._unloading and (self._status_task is None or self._status_task.done()):
+                    self._status_task = self.bot.loop.create_task(self._status_loop())
         logger.info("All settings have been reset by %s", ctx.author)
 
 def setup(bot: commands.Bot) -> None:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import asyncio
+import logging
 import re
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -21,6 +23,54 @@ DEFAULT_EVENT_MESSAGE = (
     "Hello <@&1441728661307920477>! **Game Night™** is starting now! <t:{unix}:t> (<t:{unix}:R>)."
 )
 
+log = logging.getLogger("red.fridaygamenight")
+
+_UNIX_RE = re.compile(r"\{\s*unix\s*\}", re.IGNORECASE)
+# A channel link anywhere in the argument, a whole <#id> mention, or a bare id.
+_CHANNEL_RE = re.compile(r"/channels/\d+/(\d+)|^<#(\d+)>$|^(\d+)$")
+
+# How long after its scheduled time a post may still go out (e.g. after a restart).
+POST_WINDOW = timedelta(minutes=5)
+# Longest the scheduler sleeps without re-planning. asyncio sleeps on the monotonic clock,
+# which can lag wall time after a suspend or clock step; staying under POST_WINDOW means
+# a deadline is still caught inside its window in that case.
+MAX_SLEEP = 240
+# Quiet period after a config change before the scheduler re-plans, so bursts wake it once.
+REPLAN_DELAY = 0.5
+
+def parse_hhmm(text: str) -> Optional[tuple[int, int]]:
+    """Split 'H:MM' / 'HH:MM' into (hour, minute) without range checks; None if malformed."""
+    hh, sep, mm = text.strip().partition(":")
+    if not sep or not 1 <= len(hh) <= 2 or len(mm) != 2 or not (hh.isdecimal() and mm.isdecimal()):
+        return None
+    return int(hh), int(mm)
+
+def normalize_template(template: str) -> str:
+    """Rewrite every spelling of the placeholder (e.g. '{ UNIX }') to the canonical '{unix}'."""
+    return _UNIX_RE.sub("{unix}", template)
+
+def fill_unix(template: str, unix: int) -> str:
+    """
+    Substitute {unix} placeholders; templates without a brace are returned untouched.
+    Templates normalized on save only need a plain str.replace; the regex is a fallback
+    for ones stored before normalization.
+    """
+    if "{" not in template:
+        return template
+    filled = template.replace("{unix}", str(unix))
+    if "{" not in filled:
+        return filled
+    return _UNIX_RE.sub(str(unix), filled)
+
+_WEEKDAY_ABBRS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+def format_local(dt: datetime) -> str:
+    """Format as e.g. 'Fri 2024-05-03 19:30 BST' without going through locale-dependent strftime."""
+    return (
+        f"{_WEEKDAY_ABBRS[dt.weekday()]} {dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d} {dt.tzname() or ''}"
+    ).rstrip()
+
 def userday_to_pyweekday(userday: int) -> int:
     # 1=Monday .. 7=Sunday → 0..6
     return (userday - 1) % 7
@@ -42,11 +92,7 @@ def compute_next_occurrence(
         now = now.astimezone(tzinfo)
     target_wd = userday_to_pyweekday(user_day)
     days_ahead = (target_wd - now.weekday()) % 7
-    candidate = datetime(
-        now.year, now.month, now.day,
-        hour, minute, 0,
-        tzinfo=tzinfo
-    ) + timedelta(days=days_ahead)
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0, fold=0) + timedelta(days=days_ahead)
     if candidate <= now:
         candidate += timedelta(days=7)
     return candidate
@@ -68,17 +114,13 @@ def compute_last_occurrence(
         now = now.astimezone(tzinfo)
     target_wd = userday_to_pyweekday(user_day)
     days_ago = (now.weekday() - target_wd) % 7
-    candidate = datetime(
-        now.year, now.month, now.day,
-        hour, minute, 0,
-        tzinfo=tzinfo
-    ) - timedelta(days=days_ago)
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0, fold=0) - timedelta(days=days_ago)
     if candidate > now:
         candidate -= timedelta(days=7)
     return candidate
 
-async def mod_check(ctx: commands.Context) -> bool:
-    return ctx.author.guild_permissions.manage_guild
+# Built once and shared by every config command: requires Manage Server in the guild.
+mod_check = commands.has_guild_permissions(manage_guild=True)
 
 class FridayGameNight(commands.Cog):
     """Automated weekly game night announcer with DST-aware scheduling."""
@@ -104,35 +146,148 @@ class FridayGameNight(commands.Cog):
             last_event_posted_unix=0,
         )
         self._task: Optional[asyncio.Task] = None
-        self._lock = asyncio.Lock()
+        # One lock per guild, so a slow send in one guild never holds up posts in another.
+        self._guild_locks: dict[int, asyncio.Lock] = {}
+        # Strong references to in-flight reaction tasks so they aren't garbage-collected early.
+        self._reaction_tasks: set[asyncio.Task] = set()
+        # Set by config commands so the scheduler re-plans instead of sleeping to a stale deadline.
+        self._wake_event = asyncio.Event()
+        self._replan_handle: Optional[asyncio.TimerHandle] = None
+        # guild id -> (schedule key, next due time); reused until that time has passed.
+        self._next_due_cache: dict[int, tuple[tuple, datetime]] = {}
 
     async def cog_load(self) -> None:
         self._task = self.bot.loop.create_task(self._background_loop())
 
     async def cog_unload(self) -> None:
+        if self._replan_handle:
+            self._replan_handle.cancel()
+            self._replan_handle = None
         if self._task:
             self._task.cancel()
             self._task = None
+        tasks = list(self._reaction_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._reaction_tasks.clear()
+
+    def _request_replan(self) -> None:
+        """Wake the scheduler REPLAN_DELAY seconds after the last of a burst of config changes."""
+        if self._replan_handle:
+            self._replan_handle.cancel()
+        self._replan_handle = asyncio.get_running_loop().call_later(REPLAN_DELAY, self._wake_event.set)
 
     async def _background_loop(self) -> None:
+        """
+        Handle every enabled guild, then sleep until the earliest upcoming announcement
+        or event across them (capped at MAX_SLEEP), or until a config change wakes it.
+        """
         await self.bot.wait_until_ready()
         while True:
             try:
-                now_utc = datetime.now(timezone.utc)
-                for guild in list(self.bot.guilds):
-                    try:
-                        await self._handle_guild(guild, now_utc)
-                    except Exception:
-                        self.bot.logger.exception("FGN _handle_guild error for %s", guild.id)
-                await asyncio.sleep(30)
+                now_utc = discord.utils.utcnow()
+                all_data = await self.config.all_guilds()
+                next_due: Optional[datetime] = None
+                work: list[tuple[discord.Guild, dict]] = []
+                for guild_id, data in all_data.items():
+                    if not data.get("enabled") or not data.get("channel_id"):
+                        # Nothing can be posted, so these guilds don't drive the next wake-up either.
+                        continue
+                    guild = self.bot.get_guild(guild_id)
+                    if guild is None:
+                        continue
+                    work.append((guild, data))
+                    guild_due = self._next_due(guild_id, data, now_utc)
+                    if next_due is None or guild_due < next_due:
+                        next_due = guild_due
+                # Guilds are independent (each has its own lock), so their sends can overlap.
+                results = await asyncio.gather(
+                    *(self._handle_guild(guild, data, now_utc) for guild, data in work),
+                    return_exceptions=True,
+                )
+                for (guild, _), result in zip(work, results):
+                    if isinstance(result, Exception):
+                        log.error("FGN _handle_guild error for %s", guild.id, exc_info=result)
+                sleep_for = MAX_SLEEP
+                if next_due is not None:
+                    sleep_for = min(max(next_due.timestamp() - time.time(), 1), MAX_SLEEP)
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), timeout=sleep_for)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake_event.clear()
             except asyncio.CancelledError:
                 break
             except Exception:
-                self.bot.logger.exception("FGN background loop crashed")
+                log.exception("FGN background loop crashed")
                 await asyncio.sleep(30)
 
-    async def _handle_guild(self, guild: discord.Guild, now_utc: datetime) -> None:
-        data = await self.config.guild(guild).all()
+    def _next_due(self, guild_id: int, data: dict, now_utc: datetime) -> datetime:
+        """
+        Return the next announcement or event time (whichever is sooner) for one guild's config.
+        The result is cached per guild and reused until it passes or the schedule changes.
+        """
+        key = (
+            data.get("timezone", "UTC"),
+            data["announce_day"], data["announce_hour"], data["announce_minute"],
+            data["event_day"], data["event_hour"], data["event_minute"],
+        )
+        cached = self._next_due_cache.get(guild_id)
+        if cached is not None and cached[0] == key and cached[1] > now_utc:
+            return cached[1]
+        try:
+            tz = ZoneInfo(data.get("timezone", "UTC"))
+        except Exception:
+            tz = timezone.utc
+        next_ann = compute_next_occurrence(
+            data["announce_day"], data["announce_hour"], data["announce_minute"],
+            now=now_utc, tzinfo=tz,
+        )
+        next_evt = compute_next_occurrence(
+            data["event_day"], data["event_hour"], data["event_minute"],
+            now=now_utc, tzinfo=tz,
+        )
+        due = min(next_ann, next_evt)
+        self._next_due_cache[guild_id] = (key, due)
+        return due
+
+    async def _set_fields(self, guild: discord.Guild, **values) -> None:
+        """
+        Write the given guild settings, and only those keys, so untouched fields keep following
+        their registered defaults. Every writer of guild settings goes through here, under the
+        guild's post lock, so a setter can't interleave with a post's check-send-mark sequence.
+        """
+        group = self.config.guild(guild)
+        async with self._lock_for(guild.id):
+            for key, value in values.items():
+                await group.get_attr(key).set(value)
+
+    def _react_later(self, message: discord.Message, emoji: str) -> None:
+        """Add a cosmetic reaction in the background so it doesn't delay marking the post."""
+        task = asyncio.create_task(message.add_reaction(emoji))
+        self._reaction_tasks.add(task)
+        task.add_done_callback(self._reaction_done)
+
+    def _reaction_done(self, task: asyncio.Task) -> None:
+        self._reaction_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.debug("FGN could not add reaction: %s", task.exception())
+
+    def _lock_for(self, guild_id: int) -> asyncio.Lock:
+        """Return the lock guarding one guild's post-and-mark sequence."""
+        lock = self._guild_locks.get(guild_id)
+        if lock is None:
+            lock = self._guild_locks[guild_id] = asyncio.Lock()
+        return lock
+
+    async def _handle_guild(self, guild: discord.Guild, data: dict, now_utc: datetime) -> None:
+        """
+        Post the announcement and/or event reminder for one guild if it is inside a post window.
+        data is the guild's config as read at the start of this pass; only the last-posted
+        markers are re-read (under the lock) before sending.
+        """
         if not data.get("enabled"):
             return
         chan_id = data.get("channel_id")
@@ -141,6 +296,8 @@ class FridayGameNight(commands.Cog):
         channel = guild.get_channel(chan_id)
         if channel is None:
             return
+        # Checked locally so a missing permission never costs a failed API call.
+        perms = channel.permissions_for(guild.me)
 
         # ─── TIMEZONE ───
         tz_str = data.get("timezone", "UTC")
@@ -150,83 +307,79 @@ class FridayGameNight(commands.Cog):
             tz = timezone.utc
 
         # ─── SCHEDULE ───
-        ad = int(data["announce_day"])
-        ah = int(data["announce_hour"])
-        am = int(data["announce_minute"])
-        ed = int(data["event_day"])
-        eh = int(data["event_hour"])
-        em = int(data["event_minute"])
+        ad = data["announce_day"]
+        ah = data["announce_hour"]
+        am = data["announce_minute"]
+        ed = data["event_day"]
+        eh = data["event_hour"]
+        em = data["event_minute"]
 
         # ─── DST GUARD RESET ───
         next_ann = compute_next_occurrence(ad, ah, am, now=now_utc, tzinfo=tz)
         next_evt = compute_next_occurrence(ed, eh, em, now=now_utc, tzinfo=tz)
 
-        last_ann_posted = int(data.get("last_posted_unix", 0))
+        last_ann_posted = data.get("last_posted_unix", 0)
         if last_ann_posted > int(next_ann.timestamp()):
-            await self.config.guild(guild).last_posted_unix.set(0)
+            await self._set_fields(guild, last_posted_unix=0)
             last_ann_posted = 0
 
-        last_evt_posted = int(data.get("last_event_posted_unix", 0))
+        last_evt_posted = data.get("last_event_posted_unix", 0)
         if last_evt_posted > int(next_evt.timestamp()):
-            await self.config.guild(guild).last_event_posted_unix.set(0)
+            await self._set_fields(guild, last_event_posted_unix=0)
             last_evt_posted = 0
 
         # ─── ANNOUNCEMENT ───
         last_ann_local = compute_last_occurrence(ad, ah, am, now=now_utc, tzinfo=tz)
         last_ann_utc = last_ann_local.astimezone(timezone.utc)
-        if last_ann_utc <= now_utc <= last_ann_utc + timedelta(minutes=5):
+        if last_ann_utc <= now_utc <= last_ann_utc + POST_WINDOW:
             event_local = compute_next_occurrence(ed, eh, em, now=last_ann_utc, tzinfo=tz)
             event_unix = int(event_local.timestamp())
-            lp = int(await self.config.guild(guild).last_posted_unix())
-            if lp < event_unix:
-                async with self._lock:
-                    dp = await self.config.guild(guild).all()
-                    if int(dp.get("last_posted_unix", 0)) < event_unix:
-                        template = dp.get("message", DEFAULT_MESSAGE)
-                        final = re.sub(r"\{\s*unix\s*\}", str(event_unix), template, flags=re.IGNORECASE)
+            if last_ann_posted < event_unix:
+                async with self._lock_for(guild.id):
+                    if not perms.send_messages:
+                        log.warning("FGN cannot send announcement to %s in guild %s", chan_id, guild.id)
+                    elif await self.config.guild(guild).last_posted_unix() < event_unix:
+                        template = data.get("message", DEFAULT_MESSAGE)
+                        final = fill_unix(template, event_unix)
                         allowed = discord.AllowedMentions(roles=True, users=True, everyone=False)
                         try:
                             sent = await channel.send(final, allowed_mentions=allowed)
-                            try:
-                                await sent.add_reaction("🔥")
-                            except Exception:
-                                pass
+                            if perms.add_reactions:
+                                self._react_later(sent, "🔥")
                             await self.config.guild(guild).last_posted_unix.set(event_unix)
                         except discord.Forbidden:
-                            self.bot.logger.warning(
+                            log.warning(
                                 "FGN cannot send announcement to %s in guild %s", chan_id, guild.id
                             )
                         except Exception:
-                            self.bot.logger.exception(
+                            log.exception(
                                 "FGN failed announcement in %s:%s", guild.id, chan_id
                             )
 
         # ─── EVENT‐START REMINDER ───
         last_evt_local = compute_last_occurrence(ed, eh, em, now=now_utc, tzinfo=tz)
         last_evt_utc = last_evt_local.astimezone(timezone.utc)
-        if last_evt_utc <= now_utc <= last_evt_utc + timedelta(minutes=5):
+        if last_evt_utc <= now_utc <= last_evt_utc + POST_WINDOW:
             event_unix = int(last_evt_local.timestamp())
-            lep = int(await self.config.guild(guild).last_event_posted_unix())
-            if lep < event_unix:
-                async with self._lock:
-                    dp2 = await self.config.guild(guild).all()
-                    if int(dp2.get("last_event_posted_unix", 0)) < event_unix:
-                        ev_tmpl = dp2.get("event_message", DEFAULT_EVENT_MESSAGE)
-                        ev_msg = re.sub(r"\{\s*unix\s*\}", str(event_unix), ev_tmpl, flags=re.IGNORECASE)
+            if last_evt_posted < event_unix:
+                async with self._lock_for(guild.id):
+                    if not perms.send_messages:
+                        log.warning("FGN cannot send event reminder to %s in guild %s", chan_id, guild.id)
+                    elif await self.config.guild(guild).last_event_posted_unix() < event_unix:
+                        ev_tmpl = data.get("event_message", DEFAULT_EVENT_MESSAGE)
+                        ev_msg = fill_unix(ev_tmpl, event_unix)
                         allowed = discord.AllowedMentions(roles=True, users=True, everyone=False)
                         try:
                             sent2 = await channel.send(ev_msg, allowed_mentions=allowed)
-                            try:
-                                await sent2.add_reaction("🎉")
-                            except Exception:
-                                pass
+                            if perms.add_reactions:
+                                self._react_later(sent2, "🎉")
                             await self.config.guild(guild).last_event_posted_unix.set(event_unix)
                         except discord.Forbidden:
-                            self.bot.logger.warning(
+                            log.warning(
                                 "FGN cannot send event reminder to %s in guild %s", chan_id, guild.id
                             )
                         except Exception:
-                            self.bot.logger.exception(
+                            log.exception(
                                 "FGN failed event reminder in %s:%s", guild.id, chan_id
                             )
 
@@ -237,29 +390,31 @@ class FridayGameNight(commands.Cog):
         await ctx.send_help(ctx.command)
 
     @gamenight.command()
-    @commands.check(mod_check)
+    @mod_check
     async def enable(self, ctx: commands.Context):
         """Enable automatic game night announcements."""
-        await self.config.guild(ctx.guild).enabled.set(True)
+        await self._set_fields(ctx.guild, enabled=True)
+        self._request_replan()
         await ctx.send("✅ FridayGameNight enabled.")
 
     @gamenight.command()
-    @commands.check(mod_check)
+    @mod_check
     async def disable(self, ctx: commands.Context):
         """Disable automatic game night announcements."""
-        await self.config.guild(ctx.guild).enabled.set(False)
+        await self._set_fields(ctx.guild, enabled=False)
+        self._request_replan()
         await ctx.send("❌ FridayGameNight disabled.")
 
     @gamenight.command()
-    @commands.check(mod_check)
+    @mod_check
     async def status(self, ctx: commands.Context):
         """Show current configuration and next announce/event times."""
         data = await self.config.guild(ctx.guild).all()
         enabled = data.get("enabled", False)
         ch_id = data.get("channel_id")
         tz_str = data.get("timezone", "UTC")
-        ad, ah, am = int(data["announce_day"]), int(data["announce_hour"]), int(data["announce_minute"])
-        ed, eh, em = int(data["event_day"]), int(data["event_hour"]), int(data["event_minute"])
+        ad, ah, am = data["announce_day"], data["announce_hour"], data["announce_minute"]
+        ed, eh, em = data["event_day"], data["event_hour"], data["event_minute"]
 
         try:
             tz = ZoneInfo(tz_str)
@@ -268,6 +423,8 @@ class FridayGameNight(commands.Cog):
 
         next_ann = compute_next_occurrence(ad, ah, am, tzinfo=tz)
         next_evt = compute_next_occurrence(ed, eh, em, tzinfo=tz)
+        ann_unix = int(next_ann.timestamp())
+        evt_unix = int(next_evt.timestamp())
 
         embed = discord.Embed(title="FridayGameNight Status", color=discord.Color.blurple())
         embed.add_field(name="Enabled", value=str(enabled), inline=True)
@@ -279,22 +436,22 @@ class FridayGameNight(commands.Cog):
         embed.add_field(name="Timezone", value=tz_str, inline=True)
         embed.add_field(
             name="Next Announcement (local)",
-            value=f"{next_ann:%a %Y-%m-%d %H:%M %Z}",
+            value=format_local(next_ann),
             inline=False,
         )
         embed.add_field(
             name="Next Announcement (discord t: tag)",
-            value=f"<t:{int(next_ann.timestamp())}:t> (<t:{int(next_ann.timestamp())}:R>)",
+            value=f"<t:{ann_unix}:t> (<t:{ann_unix}:R>)",
             inline=False,
         )
         embed.add_field(
             name="Next Event (local)",
-            value=f"{next_evt:%a %Y-%m-%d %H:%M %Z}",
+            value=format_local(next_evt),
             inline=False,
         )
         embed.add_field(
             name="Next Event (discord t: tag)",
-            value=f"<t:{int(next_evt.timestamp())}:t> (<t:{int(next_evt.timestamp())}:R>)",
+            value=f"<t:{evt_unix}:t> (<t:{evt_unix}:R>)",
             inline=False,
         )
         embed.add_field(name="Announce Day",   value=str(ad), inline=True)
@@ -303,13 +460,13 @@ class FridayGameNight(commands.Cog):
         embed.add_field(name="Event Time",     value=f"{eh:02d}:{em:02d}", inline=True)
 
         # Preview announcement
-        preview = re.sub(r"\{\s*unix\s*\}", str(int(next_evt.timestamp())), data.get("message", DEFAULT_MESSAGE), flags=re.IGNORECASE)
+        preview = fill_unix(data.get("message", DEFAULT_MESSAGE), evt_unix)
         if len(preview) > 1000:
             preview = preview[:990] + "…"
         embed.add_field(name="Message Preview", value=box(preview, lang=""), inline=False)
 
         # Preview event-start reminder
-        ev_preview = re.sub(r"\{\s*unix\s*\}", str(int(next_evt.timestamp())), data.get("event_message", DEFAULT_EVENT_MESSAGE), flags=re.IGNORECASE)
+        ev_preview = fill_unix(data.get("event_message", DEFAULT_EVENT_MESSAGE), evt_unix)
         if len(ev_preview) > 1000:
             ev_preview = ev_preview[:990] + "…"
         embed.add_field(name="Event-Start Preview", value=box(ev_preview, lang=""), inline=False)
@@ -317,19 +474,13 @@ class FridayGameNight(commands.Cog):
         await ctx.send(embed=embed)
 
     @gamenight.command(name="setchannel")
-    @commands.check(mod_check)
+    @mod_check
     async def setchannel(self, ctx: commands.Context, *, channel: str):
         """Set the channel for announcements."""
         chan_id: Optional[int] = None
-        m = re.search(r"/channels/\d+/(\d+)", channel)
+        m = _CHANNEL_RE.search(channel)
         if m:
-            chan_id = int(m.group(1))
-        else:
-            m = re.match(r"<#(\d+)>$", channel)
-            if m:
-                chan_id = int(m.group(1))
-            elif channel.isdigit():
-                chan_id = int(channel)
+            chan_id = int(next(g for g in m.groups() if g))
         if chan_id is None:
             try:
                 ch = await commands.TextChannelConverter().convert(ctx, channel)
@@ -339,83 +490,80 @@ class FridayGameNight(commands.Cog):
         ch_obj = ctx.guild.get_channel(chan_id)
         if ch_obj is None:
             return await ctx.send("❌ Channel not found in this guild.")
-        await self.config.guild(ctx.guild).channel_id.set(chan_id)
+        await self._set_fields(ctx.guild, channel_id=chan_id)
+        self._request_replan()
         await ctx.send(f"✅ Channel set to {ch_obj.mention}.")
 
     @gamenight.command(name="setmessage")
-    @commands.check(mod_check)
+    @mod_check
     async def setmessage(self, ctx: commands.Context, *, message: str):
         """
         Set the announcement template. Use `{unix}` to insert the event timestamp.
         """
-        await self.config.guild(ctx.guild).message.set(message)
-        await self.config.guild(ctx.guild).last_posted_unix.set(0)
+        await self._set_fields(ctx.guild, message=normalize_template(message), last_posted_unix=0)
+        self._request_replan()
         await ctx.send("✅ Message template updated.")
 
     @gamenight.command(name="seteventmessage")
-    @commands.check(mod_check)
+    @mod_check
     async def set_event_message(self, ctx: commands.Context, *, message: str):
         """
         Set the event-start reminder template. Use `{unix}` to insert the event timestamp.
         """
-        await self.config.guild(ctx.guild).event_message.set(message)
-        await self.config.guild(ctx.guild).last_event_posted_unix.set(0)
+        await self._set_fields(ctx.guild, event_message=normalize_template(message), last_event_posted_unix=0)
+        self._request_replan()
         await ctx.send("✅ Event-start reminder template updated.")
 
     @gamenight.command(name="announce_day")
-    @commands.check(mod_check)
+    @mod_check
     async def set_announce_day(self, ctx: commands.Context, day: int):
         """Set the weekday to post the announcement (1=Mon..7=Sun)."""
         if not 1 <= day <= 7:
             return await ctx.send("❌ Day must be between 1 and 7.")
-        await self.config.guild(ctx.guild).announce_day.set(day)
-        await self.config.guild(ctx.guild).last_posted_unix.set(0)
+        await self._set_fields(ctx.guild, announce_day=day, last_posted_unix=0)
+        self._request_replan()
         await ctx.send(f"✅ Announcement day set to {day}.")
 
     @gamenight.command(name="announce_time")
-    @commands.check(mod_check)
+    @mod_check
     async def set_announce_time(self, ctx: commands.Context, time_str: str):
         """Set the time (in your guild’s timezone!) to post the announcement. Format HH:MM."""
-        m = re.match(r"^(\d{1,2}):(\d{2})$", time_str.strip())
-        if not m:
+        parsed = parse_hhmm(time_str)
+        if parsed is None:
             return await ctx.send("❌ Format must be HH:MM.")
-        hr, mn = int(m.group(1)), int(m.group(2))
+        hr, mn = parsed
         if not (0 <= hr < 24 and 0 <= mn < 60):
             return await ctx.send("❌ Invalid time.")
-        await self.config.guild(ctx.guild).announce_hour.set(hr)
-        await self.config.guild(ctx.guild).announce_minute.set(mn)
-        await self.config.guild(ctx.guild).last_posted_unix.set(0)
+        await self._set_fields(ctx.guild, announce_hour=hr, announce_minute=mn, last_posted_unix=0)
+        self._request_replan()
         await ctx.send(f"✅ Announcement time set to {hr:02d}:{mn:02d} (in your guild’s timezone).")
 
     @gamenight.command(name="event_day")
-    @commands.check(mod_check)
+    @mod_check
     async def set_event_day(self, ctx: commands.Context, day: int):
         """Set the weekday for the event itself (1=Mon..7=Sun)."""
         if not 1 <= day <= 7:
             return await ctx.send("❌ Day must be between 1 and 7.")
-        await self.config.guild(ctx.guild).event_day.set(day)
-        await self.config.guild(ctx.guild).last_posted_unix.set(0)
-        await self.config.guild(ctx.guild).last_event_posted_unix.set(0)
+        await self._set_fields(ctx.guild, event_day=day, last_posted_unix=0, last_event_posted_unix=0)
+        self._request_replan()
         await ctx.send(f"✅ Event day set to {day}.")
 
     @gamenight.command(name="event_time")
-    @commands.check(mod_check)
+    @mod_check
     async def set_event_time(self, ctx: commands.Context, time_str: str):
         """Set the time (in your guild’s timezone!) for the event. Format HH:MM."""
-        m = re.match(r"^(\d{1,2}):(\d{2})$", time_str.strip())
-        if not m:
+        parsed = parse_hhmm(time_str)
+        if parsed is None:
             return await ctx.send("❌ Format must be HH:MM.")
-        hr, mn = int(m.group(1)), int(m.group(2))
+        hr, mn = parsed
         if not (0 <= hr < 24 and 0 <= mn < 60):
             return await ctx.send("❌ Invalid time.")
-        await self.config.guild(ctx.guild).event_hour.set(hr)
-        await self.config.guild(ctx.guild).event_minute.set(mn)
-        await self.config.guild(ctx.guild).last_posted_unix.set(0)
-        await self.config.guild(ctx.guild).last_event_posted_unix.set(0)
+        await self._set_fields(ctx.guild, event_hour=hr, event_minute=mn, last_posted_unix=0, last_event_posted_unix=0)
+        self._request_replan()
         await ctx.send(f"✅ Event time set to {hr:02d}:{mn:02d} (in your guild’s timezone).")
 
     @gamenight.command(name="settimezone")
-    @commands.check(mod_check)
+    @mod_check
     async def set_timezone(self, ctx: commands.Context, timezone_name: str):
         """
         Set the IANA timezone for this guild’s announcements/events.
@@ -429,9 +577,8 @@ class FridayGameNight(commands.Cog):
                 "❌ Invalid timezone. Please supply a valid IANA name "
                 "(e.g. Europe/London, America/New_York, UTC)."
             )
-        await self.config.guild(ctx.guild).timezone.set(timezone_name)
-        await self.config.guild(ctx.guild).last_posted_unix.set(0)
-        await self.config.guild(ctx.guild).last_event_posted_unix.set(0)
+        await self._set_fields(ctx.guild, timezone=timezone_name, last_posted_unix=0, last_event_posted_unix=0)
+        self._request_replan()
         await ctx.send(f"✅ Timezone set to `{timezone_name}`.")
 
     @commands.is_owner()